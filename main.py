@@ -1,46 +1,194 @@
 import os
+import asyncio
+import base64
+import binascii
 import hashlib
+import hmac
+import logging
 import secrets
+import time
+import jwt
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from cachetools import TTLCache
 from typing import List, Optional
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, EmailStr
-from database import db, create_document, get_documents
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict, EmailStr, TypeAdapter
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo.errors import BulkWriteError, DuplicateKeyError, PyMongoError
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+except ImportError:  # argon2-cffi not installed, fall back to PBKDF2-SHA512
+    PasswordHasher = None
+from database import db, aggregate_documents, create_document, create_documents
 from schemas import User as UserSchema, BlogPost as BlogPostSchema, Inquiry as InquirySchema
 
-app = FastAPI(title="Modern Minimal App API")
+logger = logging.getLogger(__name__)
+
+app = FastAPI(title="Modern Minimal App API", default_response_class=ORJSONResponse)
+
+# Explicit allow-lists let Starlette build the preflight headers once at
+# startup instead of reflecting them from each request. CORS_ORIGINS is a
+# comma-separated list of frontend origins; when unset, any origin is allowed
+# (as before) and a warning is logged at startup.
+CORS_ORIGINS = tuple(
+    origin.strip() for origin in os.getenv("CORS_ORIGINS", "").split(",") if origin.strip()
+) or ("*",)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=("GET", "POST"),
+    allow_headers=("authorization", "content-type"),
 )
 
 # -----------------
 # Helper functions
 # -----------------
 
-def hash_password(password: str, salt: Optional[str] = None):
-    if not salt:
-        salt = secrets.token_hex(16)
+# PBKDF2 (fallback and legacy hashes) must use the OpenSSL-backed C
+# implementation, which keys the HMAC once instead of every iteration. Older
+# interpreters without OpenSSL silently substitute a ~2x slower Python loop;
+# 3.12+ drops pbkdf2_hmac entirely in that case.
+_pbkdf2_hmac = getattr(hashlib, "pbkdf2_hmac", None)
+if _pbkdf2_hmac is None or _pbkdf2_hmac.__module__ == "hashlib":
+    raise RuntimeError("hashlib.pbkdf2_hmac is missing or the pure-Python fallback; an OpenSSL-backed build is required")
+
+# Argon2id is memory-hard, so each guess costs an attacker RAM as well as CPU.
+# The encoded hash is self-describing (params + salt), no separate salt field.
+PASSWORD_HASHER = (
+    PasswordHasher(time_cost=3, memory_cost=64 * 1024, parallelism=2)
+    if PasswordHasher is not None
+    else None
+)
+
+# Fallback when Argon2 is unavailable: SHA-512 runs on 64-bit words, giving
+# more work-factor per millisecond than SHA-256 on 64-bit hosts.
+PBKDF2_SHA512_TAG = "pbkdf2_sha512$"
+PBKDF2_SHA512_ITERATIONS = 210_000
+
+
+def _pbkdf2_sha512(password: str, salt: bytes) -> bytes:
+    return hashlib.pbkdf2_hmac('sha512', password.encode(), salt, PBKDF2_SHA512_ITERATIONS, dklen=64)
+
+
+def hash_password(password: str) -> str:
+    if PASSWORD_HASHER is None:
+        # Work on raw bytes; base64 is ~2/3 the size of hex when stored
+        salt = secrets.token_bytes(16)
+        dk = _pbkdf2_sha512(password, salt)
+        return f"{PBKDF2_SHA512_TAG}{base64.b64encode(salt).decode()}${base64.b64encode(dk).decode()}"
+    return PASSWORD_HASHER.hash(password)
+
+
+def _legacy_pbkdf2_hash(password: str, salt: str) -> str:
+    # Pre-Argon2 scheme: hex PBKDF2-HMAC-SHA256 digest with a separate hex salt
     dk = hashlib.pbkdf2_hmac('sha256', password.encode(), bytes.fromhex(salt), 120_000)
-    return dk.hex(), salt
+    return dk.hex()
+
+
+def verify_password(user: dict, password: str):
+    """Check a password against a stored user; returns (ok, needs_rehash)"""
+    stored = user.get("password_hash") or ""
+    if len(stored) == 64 and user.get("salt"):
+        ok = hmac.compare_digest(_legacy_pbkdf2_hash(password, user["salt"]), stored)
+        return ok, ok
+    if stored.startswith(PBKDF2_SHA512_TAG):
+        salt, _, digest = stored[len(PBKDF2_SHA512_TAG):].partition("$")
+        try:
+            salt, digest = base64.b64decode(salt, validate=True), base64.b64decode(digest, validate=True)
+        except binascii.Error:
+            return False, False
+        ok = hmac.compare_digest(_pbkdf2_sha512(password, salt), digest)
+        return ok, ok and PASSWORD_HASHER is not None
+    if PASSWORD_HASHER is None:
+        return False, False
+    try:
+        PASSWORD_HASHER.verify(stored, password)
+    except (VerificationError, InvalidHashError):
+        return False, False
+    return True, PASSWORD_HASHER.check_needs_rehash(stored)
+
+# The KDF is CPU-bound (~100ms); run it off the event loop so DB I/O and
+# token issuance for other requests keep flowing while a hash is computed.
+KDF_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+async def run_kdf(func, *args):
+    return await asyncio.get_running_loop().run_in_executor(KDF_POOL, func, *args)
+
+# Stateless signed tokens: verification is one HMAC, nothing is stored
+# server-side, and any worker can verify a token issued by another. Set
+# JWT_SECRET in production; the random fallback only suits a single process.
+JWT_SECRET_FROM_ENV = bool(os.getenv("JWT_SECRET"))
+JWT_SECRET = os.getenv("JWT_SECRET") or secrets.token_urlsafe(32)
+JWT_ALGORITHM = "HS256"
+TOKEN_TTL = timedelta(hours=1)
+
 
-# In-memory token store for demo (non-persistent, acceptable for this environment)
-# Note: We still use DB for user data. Tokens are ephemeral for preview purposes.
-TOKENS = {}
+def issue_token(email: str, name: str) -> str:
+    claims = {"email": email, "name": name, "exp": datetime.now(timezone.utc) + TOKEN_TTL}
+    return jwt.encode(claims, JWT_SECRET, algorithm=JWT_ALGORITHM)
+
+# Per-IP fixed-window counters in front of the KDF so the hashing cost can't
+# be turned against us. Login only counts failures, so legitimate users behind
+# a shared address aren't throttled by each other's successful sign-ins;
+# signup hashes on every call and has its own bucket.
+AUTH_ATTEMPT_LIMIT = 5
+AUTH_ATTEMPT_WINDOW = 60
+# Entry TTL only bounds memory; the window itself is tracked explicitly because
+# re-setting a TTLCache key restarts its expiry
+LOGIN_FAILURES = TTLCache(maxsize=100_000, ttl=AUTH_ATTEMPT_WINDOW)
+SIGNUP_ATTEMPTS = TTLCache(maxsize=100_000, ttl=AUTH_ATTEMPT_WINDOW)
+
+
+def client_ip(request: Request) -> str:
+    # Behind a reverse proxy this is only the real client if uvicorn trusts
+    # the proxy's X-Forwarded-For (see FORWARDED_ALLOW_IPS in start_server.sh)
+    return request.client.host if request.client else "unknown"
+
+
+def _current_window(bucket: TTLCache, ip: str):
+    now = time.monotonic()
+    window_start, attempts = bucket.get(ip, (now, 0))
+    if now - window_start >= AUTH_ATTEMPT_WINDOW:
+        return now, 0
+    return window_start, attempts
+
+
+def check_auth_rate(bucket: TTLCache, ip: str):
+    _, attempts = _current_window(bucket, ip)
+    if attempts >= AUTH_ATTEMPT_LIMIT:
+        raise HTTPException(status_code=429, detail="Too many attempts, try again later")
+
+
+def record_auth_attempt(bucket: TTLCache, ip: str):
+    window_start, attempts = _current_window(bucket, ip)
+    bucket[ip] = (window_start, attempts + 1)
 
 # -----------------
 # Request/Response models
 # -----------------
+# Request bodies are read-only and ignore unknown keys. Passwords must not be
+# whitespace-stripped, so stripping is only enabled on the non-auth models.
+REQUEST_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
 class SignupRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     name: str
     email: EmailStr
     password: str
 
 class LoginRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     email: EmailStr
     password: str
 
@@ -50,6 +198,8 @@ class AuthResponse(BaseModel):
     email: EmailStr
 
 class ContactRequest(BaseModel):
+    model_config = ConfigDict(**REQUEST_MODEL_CONFIG, str_strip_whitespace=True)
+
     name: str
     email: EmailStr
     message: str
@@ -59,20 +209,75 @@ class DashboardStats(BaseModel):
     stats: dict
     quick_actions: List[dict]
 
+AUTH_RESPONSE_ADAPTER = TypeAdapter(AuthResponse)
+
+
+def auth_response(token: str, name: str, email: str) -> Response:
+    # Values are already validated; serialize directly and skip FastAPI's
+    # response_model re-validation on the auth hot path
+    body = AuthResponse.model_construct(token=token, name=name, email=email)
+    return Response(content=AUTH_RESPONSE_ADAPTER.dump_json(body), media_type="application/json")
+
+# -----------------
+# Startup
+# -----------------
+@app.on_event("startup")
+async def ensure_indexes():
+    # Unique indexes turn email/slug lookups into B-tree probes and make
+    # uniqueness a server-side guarantee instead of a check-then-insert race
+    if db is None:
+        return
+    # Don't block boot on the database: an unreachable server or existing
+    # duplicates are logged and left for /test to report
+    try:
+        await db["user"].create_index("email", unique=True)
+        await db["blogpost"].create_index("slug", unique=True)
+        await db["blogpost"].create_index([("published_at", -1), ("_id", -1)])
+    except PyMongoError as e:
+        logger.error("Could not create indexes; continuing without them: %s", e)
+
+@app.on_event("startup")
+async def warn_on_missing_config():
+    if not JWT_SECRET_FROM_ENV:
+        logger.warning(
+            "JWT_SECRET is not set; using a random per-process secret. Tokens will not "
+            "verify across workers or after a restart/reload, and users will appear as Guest."
+        )
+    if CORS_ORIGINS == ("*",):
+        logger.warning(
+            "CORS_ORIGINS is not set; allowing requests from ANY origin. Set it to the "
+            "comma-separated list of frontend origins for this deployment."
+        )
+
 # -----------------
 # Basic routes
 # -----------------
 @app.get("/")
-def read_root():
+async def read_root():
     return {"message": "Modern Minimal App Backend Running"}
 
+# Env config doesn't change after startup
+DATABASE_URL_STATUS = "✅ Set" if os.getenv("DATABASE_URL") else "❌ Not Set"
+DATABASE_NAME_STATUS = "✅ Set" if os.getenv("DATABASE_NAME") else "❌ Not Set"
+
+# Health checks hit /test often; don't issue listCollections on every probe
+COLLECTIONS_CACHE = TTLCache(maxsize=1, ttl=60)
+
+
+async def _list_collections() -> list:
+    collections = COLLECTIONS_CACHE.get(())
+    if collections is None:
+        collections = COLLECTIONS_CACHE[()] = await db.list_collection_names()
+    return collections
+
+
 @app.get("/test")
-def test_database():
+async def test_database():
     response = {
         "backend": "✅ Running",
         "database": "❌ Not Available",
-        "database_url": "✅ Set" if os.getenv("DATABASE_URL") else "❌ Not Set",
-        "database_name": "✅ Set" if os.getenv("DATABASE_NAME") else "❌ Not Set",
+        "database_url": DATABASE_URL_STATUS,
+        "database_name": DATABASE_NAME_STATUS,
         "connection_status": "Not Connected",
         "collections": []
     }
@@ -80,7 +285,7 @@ def test_database():
         if db is not None:
             response["database"] = "✅ Available"
             try:
-                response["collections"] = db.list_collection_names()
+                response["collections"] = await _list_collections()
                 response["connection_status"] = "Connected"
                 response["database"] = "✅ Connected & Working"
             except Exception as e:
@@ -95,81 +300,113 @@ def test_database():
 # Auth endpoints
 # -----------------
 @app.post("/api/auth/signup", response_model=AuthResponse)
-def signup(payload: SignupRequest):
-    # Check if user exists
-    existing = db["user"].find_one({"email": payload.email}) if db else None
-    if existing:
-        raise HTTPException(status_code=400, detail="Email already registered")
-    password_hash, salt = hash_password(payload.password)
+async def signup(payload: SignupRequest, request: Request):
+    ip = client_ip(request)
+    check_auth_rate(SIGNUP_ATTEMPTS, ip)
+    record_auth_attempt(SIGNUP_ATTEMPTS, ip)
     user_doc = UserSchema(
         name=payload.name,
         email=payload.email,
-        password_hash=password_hash,
-        salt=salt,
+        password_hash=await run_kdf(hash_password, payload.password),
     )
-    _id = create_document("user", user_doc)
-    token = secrets.token_urlsafe(24)
-    TOKENS[token] = {
-        "email": payload.email,
-        "name": payload.name,
-    }
-    return AuthResponse(token=token, name=payload.name, email=payload.email)
+    # The unique email index rejects duplicates atomically
+    try:
+        _id = await create_document("user", user_doc)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already registered")
+    token = issue_token(payload.email, payload.name)
+    return auth_response(token, payload.name, payload.email)
 
 @app.post("/api/auth/login", response_model=AuthResponse)
-def login(payload: LoginRequest):
-    user = db["user"].find_one({"email": payload.email}) if db else None
+async def login(payload: LoginRequest, request: Request):
+    ip = client_ip(request)
+    check_auth_rate(LOGIN_FAILURES, ip)
+    user = await db["user"].find_one(
+        {"email": payload.email}, {"password_hash": 1, "salt": 1, "name": 1, "email": 1}
+    ) if db is not None else None
     if not user:
+        record_auth_attempt(LOGIN_FAILURES, ip)
         raise HTTPException(status_code=401, detail="Invalid credentials")
-    computed_hash, _ = hash_password(payload.password, user.get("salt"))
-    if computed_hash != user.get("password_hash"):
+    ok, needs_rehash = await run_kdf(verify_password, user, payload.password)
+    if not ok:
+        record_auth_attempt(LOGIN_FAILURES, ip)
         raise HTTPException(status_code=401, detail="Invalid credentials")
-    token = secrets.token_urlsafe(24)
-    TOKENS[token] = {
-        "email": user["email"],
-        "name": user.get("name", "")
-    }
-    return AuthResponse(token=token, name=TOKENS[token]["name"], email=user["email"])
+    if needs_rehash:
+        # Upgrade legacy PBKDF2 hashes / outdated Argon2 params in place
+        await db["user"].update_one(
+            {"_id": user["_id"]},
+            {"$set": {"password_hash": await run_kdf(hash_password, payload.password)}, "$unset": {"salt": ""}},
+        )
+    token = issue_token(user["email"], user.get("name", ""))
+    return auth_response(token, user.get("name", ""), user["email"])
 
 # Simple dependency to get current user from token (if provided)
-class TokenHeader(BaseModel):
-    token: Optional[str] = None
-
-
 def get_current_user(token: Optional[str] = None):
-    if token and token in TOKENS:
-        return TOKENS[token]
-    return None
+    if not token:
+        return None
+    try:
+        claims = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+    except jwt.PyJWTError:
+        return None
+    return {"email": claims.get("email"), "name": claims.get("name", "")}
 
 # -----------------
 # Dashboard
 # -----------------
-@app.get("/api/dashboard", response_model=DashboardStats)
-def dashboard(token: Optional[str] = None):
+QUICK_ACTIONS = (
+    {"label": "Create Post", "href": "/blog/new"},
+    {"label": "View Articles", "href": "/blog"},
+    {"label": "Contact Support", "href": "/contact"},
+)
+
+# Counts barely move minute-to-minute; serve them from a short-lived cache
+STATS_CACHE = TTLCache(maxsize=1, ttl=30)
+_stats_lock = asyncio.Lock()
+
+
+async def _get_stats() -> dict:
+    stats = STATS_CACHE.get(())
+    if stats is not None:
+        return stats
+    # Only one coroutine refreshes on a miss; the rest wait and reuse its result
+    async with _stats_lock:
+        stats = STATS_CACHE.get(())
+        if stats is not None:
+            return stats
+        # Metadata-based counts, issued concurrently: one round-trip of latency
+        users_count, posts_count, inquiries_count = 0, 0, 0
+        if db is not None:
+            users_count, posts_count, inquiries_count = await asyncio.gather(
+                db["user"].estimated_document_count(),
+                db["blogpost"].estimated_document_count(),
+                db["inquiry"].estimated_document_count(),
+            )
+        stats = {
+            "Users": users_count,
+            "Articles": posts_count,
+            "Inquiries": inquiries_count
+        }
+        STATS_CACHE[()] = stats
+        return stats
+
+
+@app.get("/api/dashboard", response_model=None, responses={200: {"model": DashboardStats}})
+async def dashboard(token: Optional[str] = None):
     user = get_current_user(token)
     name = user["name"] if user else "Guest"
     email = user["email"] if user else None
-    # Example stats (some depend on DB counts)
-    users_count = db["user"].count_documents({}) if db else 0
-    posts_count = db["blogpost"].count_documents({}) if db else 0
-    inquiries_count = db["inquiry"].count_documents({}) if db else 0
-    stats = {
-        "Users": users_count,
-        "Articles": posts_count,
-        "Inquiries": inquiries_count
-    }
+    # Example stats (some depend on DB counts); copy so the cached dict stays shared-safe
+    stats = dict(await _get_stats())
     if email:
         stats["Your Email"] = email
-    quick_actions = [
-        {"label": "Create Post", "href": "/blog/new"},
-        {"label": "View Articles", "href": "/blog"},
-        {"label": "Contact Support", "href": "/contact"},
-    ]
-    return DashboardStats(welcome=f"Welcome, {name}", stats=stats, quick_actions=quick_actions)
+    return {"welcome": f"Welcome, {name}", "stats": stats, "quick_actions": QUICK_ACTIONS}
 
 # -----------------
 # Blog
 # -----------------
 class BlogCreate(BaseModel):
+    model_config = ConfigDict(**REQUEST_MODEL_CONFIG, str_strip_whitespace=True)
+
     title: str
     slug: str
     excerpt: Optional[str] = None
@@ -179,47 +416,105 @@ class BlogCreate(BaseModel):
     cover_image: Optional[str] = None
 
 @app.get("/api/blogs")
-def list_blogs(limit: int = 20):
-    items = get_documents("blogpost", {}, limit)
-    # sanitize ObjectId
-    for it in items:
-        it["id"] = str(it.pop("_id", ""))
-    return {"items": items}
+async def list_blogs(limit: int = Query(20, ge=1, le=100), before: Optional[datetime] = None, before_id: Optional[str] = None):
+    # Newest first, keyset-paginated on the (published_at, _id) index; sort+limit
+    # lets Mongo stop after `limit` docs instead of sorting the collection.
+    # _id breaks ties between posts published in the same millisecond.
+    filter_dict = {}
+    if before_id and not before:
+        # The id only breaks ties within a timestamp; ignoring it would
+        # silently return the first page again and loop a paging client
+        raise HTTPException(status_code=400, detail="before_id requires before")
+    if before and before_id:
+        try:
+            oid = ObjectId(before_id)
+        except InvalidId:
+            raise HTTPException(status_code=400, detail="Invalid before_id")
+        filter_dict = {"$or": [
+            {"published_at": {"$lt": before}},
+            {"published_at": before, "_id": {"$lt": oid}},
+        ]}
+    elif before:
+        filter_dict = {"published_at": {"$lt": before}}
+    cursor = aggregate_documents("blogpost", [
+        {"$match": filter_dict},
+        {"$sort": {"published_at": -1, "_id": -1}},
+        {"$limit": limit},
+        # ObjectId -> string happens server-side, so documents come back ready
+        # to serialize; listings don't need the (potentially large) markdown body
+        {"$set": {"id": {"$toString": "$_id"}}},
+        {"$project": {"_id": 0, "content": 0}},
+    ], batch_size=50)
+
+    # Pull the first batch before committing to a 200, so connection and
+    # query errors surface as a normal HTTP error rather than truncated JSON
+    try:
+        first = await cursor.next()
+    except StopAsyncIteration:
+        first = None
+
+    # Stream items straight off the cursor so memory stays O(batch_size)
+    async def body():
+        yield b'{"items":['
+        count, last = 0, None
+        if first is not None:
+            yield orjson.dumps(first)
+            count, last = 1, first
+            async for it in cursor:
+                yield b"," + orjson.dumps(it)
+                count, last = count + 1, it
+        # Cursor for the next page: pass these back as `before` / `before_id`
+        next_before, next_before_id = None, None
+        # Posts without published_at can't be used as a keyset cursor
+        if last is not None and count == limit and last.get("published_at") is not None:
+            next_before, next_before_id = last["published_at"], last["id"]
+        yield b'],"next_before":' + orjson.dumps(next_before) + b',"next_before_id":' + orjson.dumps(next_before_id) + b"}"
+
+    return StreamingResponse(body(), media_type="application/json")
 
 @app.get("/api/blogs/{slug}")
-def get_blog(slug: str):
-    doc = db["blogpost"].find_one({"slug": slug}) if db else None
+async def get_blog(slug: str):
+    doc = await db["blogpost"].find_one({"slug": slug}) if db is not None else None
     if not doc:
         raise HTTPException(status_code=404, detail="Post not found")
     doc["id"] = str(doc.pop("_id", ""))
     return doc
 
 @app.post("/api/blogs")
-def create_blog(payload: BlogCreate):
-    # upsert by slug
-    exists = db["blogpost"].find_one({"slug": payload.slug}) if db else None
-    blog = BlogPostSchema(**payload.model_dump())
-    if exists:
-        db["blogpost"].update_one({"slug": payload.slug}, {"$set": blog.model_dump()})
+async def create_blog(payload: BlogCreate):
+    # upsert by slug in a single round-trip
+    blog = BlogPostSchema(**payload.model_dump()).model_dump()
+    # published_at is the pagination key; only set it when the post is created
+    published_at = blog.pop("published_at")
+    now = datetime.now(timezone.utc)
+    result = await db["blogpost"].update_one(
+        {"slug": payload.slug},
+        {
+            "$set": {**blog, "updated_at": now},
+            "$setOnInsert": {"created_at": now, "published_at": published_at},
+        },
+        upsert=True,
+    )
+    if result.upserted_id is None:
         return {"status": "updated", "slug": payload.slug}
-    _id = create_document("blogpost", blog)
-    return {"status": "created", "id": _id}
+    return {"status": "created", "id": str(result.upserted_id)}
 
 # -----------------
 # Contact
 # -----------------
 @app.post("/api/contact")
-def contact(payload: ContactRequest):
+async def contact(payload: ContactRequest):
     inquiry = InquirySchema(**payload.model_dump())
-    _id = create_document("inquiry", inquiry)
+    _id = await create_document("inquiry", inquiry)
     return {"status": "received", "id": _id}
 
 # -----------------
 # Seed sample content (idempotent)
 # -----------------
-@app.post("/api/seed")
-def seed_content():
-    samples = [
+# Validated once at import; the endpoint only stamps published_at per insert
+SAMPLE_POSTS = [
+    BlogPostSchema(**s).model_dump()
+    for s in (
         {
             "title": "Designing With Purpose",
             "slug": "designing-with-purpose",
@@ -238,15 +533,26 @@ def seed_content():
             "tags": ["motion", "ui"],
             "cover_image": None,
         },
-    ]
+    )
+]
+
+@app.post("/api/seed")
+async def seed_content():
+    # One query to find what already exists, one bulk insert for the rest
+    cursor = db["blogpost"].find({"slug": {"$in": [s["slug"] for s in SAMPLE_POSTS]}}, {"slug": 1})
+    existing = {d["slug"] async for d in cursor}
+    now = datetime.now(timezone.utc)
+    to_insert = [{**s, "published_at": now} for s in SAMPLE_POSTS if s["slug"] not in existing]
     created = 0
-    for s in samples:
-        if not db["blogpost"].find_one({"slug": s["slug"]}):
-            create_document("blogpost", BlogPostSchema(**s))
-            created += 1
+    if to_insert:
+        # A concurrent seed may insert the same slugs first; the unique index
+        # rejects those and the rest of the unordered batch still goes in
+        try:
+            created = len(await create_documents("blogpost", to_insert))
+        except BulkWriteError as e:
+            created = e.details["nInserted"]
     return {"status": "ok", "created": created}
 
-
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
@@ -23,8 +23,7 @@ class User(BaseModel):
     """
     name: str = Field(..., description="Full name")
     email: EmailStr = Field(..., description="Email address")
-    password_hash: str = Field(..., description="Password hash (PBKDF2)")
-    salt: str = Field(..., description="Per-user salt for hashing")
+    password_hash: str = Field(..., description="Encoded password hash (Argon2id, or pbkdf2_sha512$<b64 salt>$<b64 hash>)")
     avatar_url: Optional[str] = Field(None, description="Avatar image URL")
     created_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
     is_active: bool = Field(True, description="Whether user is active")
@@ -14,6 +14,13 @@ fi
 mkdir -p logs
 echo "Installing dependencies..."
 pip install -r requirements.txt
+if [ -z "$CORS_ORIGINS" ]; then
+  echo "WARNING: CORS_ORIGINS is not set; the API will accept requests from any origin."
+  echo "         Set it to the comma-separated frontend origin(s), e.g. CORS_ORIGINS=https://app.example.com"
+fi
 echo "Starting FastAPI server..."
-nohup uvicorn main:app --host 0.0.0.0 --port 8000 --reload > logs/server.log 2>&1 
+# Trust X-Forwarded-For from the reverse proxy so per-IP auth rate limits see
+# the real client address; set FORWARDED_ALLOW_IPS to the proxy's IP(s)
+nohup uvicorn main:app --host 0.0.0.0 --port 8000 --reload \
+  --proxy-headers --forwarded-allow-ips "${FORWARDED_ALLOW_IPS:-127.0.0.1}" > logs/server.log 2>&1 
 echo "Server started in background"